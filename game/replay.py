@@ -0,0 +1,212 @@
+"""
+Log Replay
+Re-runs logged games through the engine and reports any divergence.
+
+Logs are read one file at a time by worker processes, so memory use stays
+flat no matter how many games are being checked.
+"""
+
+import os
+import time
+import multiprocessing
+from itertools import islice
+from pathlib import Path
+
+from game.engine import create_game_state, guess_letter, guess_word
+from game.engine import has_won, calculate_score
+
+
+WORD_GUESS_PREFIX = "WORD: "
+
+# Number of log files handed to a worker at once
+REPLAY_BATCH_SIZE = 500
+
+
+def parse_log(log_file):
+    """
+    Parse a game log written by save_log().
+
+    Args:
+        log_file: Path to a log.txt file
+
+    Returns:
+        Dictionary with category, word, guesses (list of (guess, result)),
+        wrong_guesses, remaining_attempts, result and points; fields
+        missing from the log are absent
+    """
+    record = {'guesses': []}
+    in_guesses = False
+
+    with open(log_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+
+            if in_guesses:
+                if not line.strip():
+                    in_guesses = False
+                    continue
+                entry = line.partition('. ')[2]
+                guess, _, result = entry.rpartition(' → ')
+                record['guesses'].append((guess, result))
+            elif line == "Guesses (in order):":
+                in_guesses = True
+            elif line.startswith("Category: "):
+                record['category'] = line[len("Category: "):]
+            elif line.startswith("Word: "):
+                record['word'] = line[len("Word: "):]
+            elif line.startswith("Wrong Guesses Count: "):
+                record['wrong_guesses'] = int(line[len("Wrong Guesses Count: "):])
+            elif line.startswith("Remaining Attempts at End: "):
+                record['remaining_attempts'] = int(line[len("Remaining Attempts at End: "):])
+            elif line.startswith("Result: "):
+                record['result'] = line[len("Result: "):]
+            elif line.startswith("Points Earned: "):
+                record['points'] = int(line[len("Points Earned: "):])
+            elif line.startswith("Session Notes:"):
+                break
+
+    return record
+
+
+def replay_game(record):
+    """
+    Re-run a parsed game and compare it with what the log recorded.
+
+    Args:
+        record: Dictionary returned by parse_log()
+
+    Returns:
+        List of strings describing each divergence (empty if none)
+    """
+    required = ('word', 'wrong_guesses', 'remaining_attempts', 'result', 'points')
+    missing = [field for field in required if field not in record]
+    if missing:
+        return [f"could not parse {', '.join(missing)}"]
+
+    game_state = create_game_state(record['word'], record.get('category'), 0)
+    divergences = []
+
+    history = game_state['guess_history']
+    for i, (guess, expected) in enumerate(record['guesses'], 1):
+        entries_before = len(history)
+        if guess.startswith(WORD_GUESS_PREFIX):
+            guess_word(game_state, guess[len(WORD_GUESS_PREFIX):])
+        else:
+            guess_letter(game_state, guess)
+
+        # Each logged guess must add exactly one matching history entry
+        new_entries = history[entries_before:]
+        if not new_entries:
+            divergences.append(f"guess {i} '{guess}': expected {expected}, not recorded")
+        elif len(new_entries) > 1:
+            divergences.append(f"guess {i} '{guess}': expected 1 entry, got {len(new_entries)}")
+        elif new_entries[0] != (guess, expected):
+            actual_guess, actual = new_entries[0]
+            divergences.append(f"guess {i} '{guess}': expected {expected}, "
+                               f"got '{actual_guess}' {actual}")
+
+    if game_state['wrong_guesses'] != record['wrong_guesses']:
+        divergences.append(f"wrong guesses: expected {record['wrong_guesses']}, "
+                           f"got {game_state['wrong_guesses']}")
+
+    if game_state['remaining_attempts'] != record['remaining_attempts']:
+        divergences.append(f"remaining attempts: expected {record['remaining_attempts']}, "
+                           f"got {game_state['remaining_attempts']}")
+
+    result = "Win" if has_won(game_state) else "Loss"
+    if result != record['result']:
+        divergences.append(f"result: expected {record['result']}, got {result}")
+
+    score = calculate_score(game_state)
+    if score != record['points']:
+        divergences.append(f"points: expected {record['points']}, got {score}")
+
+    return divergences
+
+
+def replay_batch(log_files):
+    """
+    Parse and replay a batch of log files.
+
+    Args:
+        log_files: List of log file paths
+
+    Returns:
+        Tuple of (games_in_batch, failures), where failures is a list of
+        (log_file, divergences) tuples for games that diverged
+    """
+    failures = []
+    for log_file in log_files:
+        try:
+            divergences = replay_game(parse_log(log_file))
+        except (OSError, ValueError) as e:
+            divergences = [f"could not read log: {e}"]
+        if divergences:
+            failures.append((str(log_file), divergences))
+    return len(log_files), failures
+
+
+def iter_log_files(log_dir="game_log"):
+    """
+    Yield every game log file under the log directory.
+
+    Args:
+        log_dir: Directory containing gameN/log.txt folders
+
+    Yields:
+        Path of each log file (nothing if the directory does not exist)
+    """
+    if not Path(log_dir).is_dir():
+        return
+    for entry in os.scandir(log_dir):
+        if entry.is_dir() and entry.name.startswith("game"):
+            log_file = Path(entry.path) / "log.txt"
+            if log_file.exists():
+                yield log_file
+
+
+def iter_batches(items, size):
+    """
+    Group an iterable into lists of at most size items.
+
+    Args:
+        items: Any iterable
+        size: Maximum batch length
+
+    Yields:
+        Lists of items
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def replay_logs(log_dir="game_log", num_workers=None, batch_size=REPLAY_BATCH_SIZE):
+    """
+    Replay every logged game in parallel batches.
+
+    Args:
+        log_dir: Directory containing gameN/log.txt folders
+        num_workers: Number of worker processes (defaults to CPU count)
+        batch_size: Number of log files per batch
+
+    Returns:
+        Tuple of (games_checked, failures, elapsed_seconds), where failures
+        is a list of (log_file, divergences) tuples
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    games_checked = 0
+    failures = []
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(num_workers) as pool:
+        batches = iter_batches(iter_log_files(log_dir), batch_size)
+        for batch_count, batch_failures in pool.imap_unordered(replay_batch, batches):
+            games_checked += batch_count
+            failures.extend(batch_failures)
+    elapsed = time.perf_counter() - start
+
+    return games_checked, failures, elapsed
@@ -0,0 +1,357 @@
+"""
+Session Supervisor
+Runs automated game sessions across multiple worker processes.
+
+The wordlist is packed once into a shared memory block that every worker
+reads from directly. Workers play their shard of games and send each
+outcome and score back to the supervisor (plus the full game state when
+logs are written), which is the only process that touches the statistics
+and the game logs.
+"""
+
+import os
+import queue
+import random
+import struct
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+
+from game.engine import create_game_state, guess_letter, is_game_over
+from game.engine import has_won, calculate_score, save_log
+
+
+# Letters in rough order of frequency in English words
+LETTER_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+
+# Number of finished games a worker sends to the supervisor at once
+RESULT_BATCH_SIZE = 256
+
+# Seconds to wait for results before checking that the workers are alive
+RESULT_TIMEOUT = 1.0
+
+# Smallest throughput gain expected from adding workers in the load test
+MIN_SCALING_GAIN = 1.1
+
+HEADER_FORMAT = "<I"
+OFFSET_FORMAT = "<I"
+# Start and end offsets of one entry, read together
+OFFSET_PAIR_FORMAT = OFFSET_FORMAT[0] + OFFSET_FORMAT[1:] * 2
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+
+
+def share_wordlist(wordlist):
+    """
+    Pack the wordlist into a new shared memory block.
+
+    Layout: entry count, then one offset per entry (plus an end offset),
+    then the entries themselves as UTF-8 "category\\tword" strings.
+
+    Args:
+        wordlist: Dictionary of categories and words
+
+    Returns:
+        SharedMemory block; the caller must close() and unlink() it
+    """
+    entries = [f"{category}\t{word}".encode('utf-8')
+               for category, words in wordlist.items()
+               for word in words]
+
+    data_start = HEADER_SIZE + OFFSET_SIZE * (len(entries) + 1)
+    size = data_start + sum(len(entry) for entry in entries)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    struct.pack_into(HEADER_FORMAT, shm.buf, 0, len(entries))
+
+    position = data_start
+    for i, entry in enumerate(entries):
+        struct.pack_into(OFFSET_FORMAT, shm.buf, HEADER_SIZE + i * OFFSET_SIZE, position)
+        shm.buf[position:position + len(entry)] = entry
+        position += len(entry)
+    struct.pack_into(OFFSET_FORMAT, shm.buf, HEADER_SIZE + len(entries) * OFFSET_SIZE, position)
+
+    return shm
+
+
+def get_shared_word_count(buf):
+    """
+    Get the number of words stored in a shared wordlist.
+
+    Args:
+        buf: Buffer of a block created by share_wordlist()
+
+    Returns:
+        Integer count of words
+    """
+    return struct.unpack_from(HEADER_FORMAT, buf, 0)[0]
+
+
+def get_shared_word(buf, index):
+    """
+    Read a single word from a shared wordlist.
+
+    Args:
+        buf: Buffer of a block created by share_wordlist()
+        index: Position of the word (0 to count - 1)
+
+    Returns:
+        Tuple of (word, category)
+    """
+    offset_pos = HEADER_SIZE + index * OFFSET_SIZE
+    start, end = struct.unpack_from(OFFSET_PAIR_FORMAT, buf, offset_pos)
+    category, word = bytes(buf[start:end]).decode('utf-8').split('\t', 1)
+    return word, category
+
+
+def play_automated_game(game_state):
+    """
+    Play a game to the end by guessing letters in frequency order.
+
+    Args:
+        game_state: Dictionary containing current game state
+
+    Returns:
+        The same game state, finished
+    """
+    for letter in LETTER_ORDER:
+        if is_game_over(game_state):
+            break
+        guess_letter(game_state, letter)
+    return game_state
+
+
+def run_worker(shm_name, num_games, result_queue, seed, write_logs):
+    """
+    Play a shard of games and report the results to the supervisor.
+
+    Args:
+        shm_name: Name of the shared wordlist block
+        num_games: Number of games this worker plays
+        result_queue: Queue receiving lists of (won, score, game_state)
+            tuples, followed by None once the whole shard is done
+        seed: Seed for this worker's word selection
+        write_logs: Whether to send the full game state for logging;
+            if False, game_state is None
+    """
+    rng = random.Random(seed)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        word_count = get_shared_word_count(shm.buf)
+        batch = []
+        for _ in range(num_games):
+            word, category = get_shared_word(shm.buf, rng.randrange(word_count))
+            # Game numbers are assigned by the supervisor when recorded
+            game_state = play_automated_game(create_game_state(word, category, 0))
+            batch.append((has_won(game_state), calculate_score(game_state),
+                          game_state if write_logs else None))
+            if len(batch) >= RESULT_BATCH_SIZE:
+                result_queue.put(batch)
+                batch = []
+        if batch:
+            result_queue.put(batch)
+        result_queue.put(None)
+    finally:
+        shm.close()
+
+
+def record_game(stats, won, score, game_state=None):
+    """
+    Add a finished game to the statistics and optionally write its log.
+
+    Args:
+        stats: Dictionary containing game statistics
+        won: Whether the game was won
+        score: Points earned in the game
+        game_state: Dictionary containing the finished game state, or
+            None to skip writing the log
+    """
+    if won:
+        stats["wins"] += 1
+        stats["total_score"] += score
+    else:
+        stats["losses"] += 1
+    stats["games_played"] += 1
+
+    if game_state is not None:
+        game_state['game_number'] = stats["games_played"]
+        save_log(game_state, stats)
+
+
+def record_batch(stats, batch):
+    """
+    Record one item received from a worker.
+
+    Args:
+        stats: Dictionary containing game statistics
+        batch: List of (won, score, game_state) tuples, or None if the
+            worker has finished its shard
+
+    Returns:
+        1 if the item marks a finished worker, otherwise 0
+    """
+    if batch is None:
+        return 1
+    for won, score, game_state in batch:
+        record_game(stats, won, score, game_state)
+    return 0
+
+
+def split_games(num_games, num_workers):
+    """
+    Split a number of games into per-worker shards.
+
+    Args:
+        num_games: Total number of games
+        num_workers: Number of worker processes
+
+    Returns:
+        List of game counts, one per worker
+
+    Raises:
+        ValueError: If either count is less than 1
+    """
+    if num_games < 1 or num_workers < 1:
+        raise ValueError("Number of games and workers must be at least 1")
+    base, extra = divmod(num_games, num_workers)
+    return [base + (1 if i < extra else 0) for i in range(num_workers)]
+
+
+def check_workers(workers):
+    """
+    Raise an error if any worker process has failed.
+
+    Args:
+        workers: List of worker processes
+
+    Raises:
+        RuntimeError: If a worker exited with a non-zero code
+    """
+    for worker in workers:
+        if worker.exitcode not in (None, 0):
+            raise RuntimeError(f"Worker {worker.name} exited with code {worker.exitcode}")
+
+
+def run_sessions(wordlist, num_workers, num_games, stats, write_logs=True, seed=None):
+    """
+    Play games across worker processes and aggregate the results.
+
+    Args:
+        wordlist: Dictionary of categories and words
+        num_workers: Number of worker processes
+        num_games: Total number of games to play
+        stats: Dictionary containing game statistics, updated in place
+        write_logs: Whether to save a log for every game
+        seed: Optional base seed for word selection
+
+    Returns:
+        Elapsed time in seconds
+
+    Raises:
+        ValueError: If num_workers or num_games is less than 1
+        RuntimeError: If a worker fails before finishing its shard
+    """
+    shards = split_games(num_games, num_workers)
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    shm = share_wordlist(wordlist)
+    result_queue = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=run_worker,
+                                args=(shm.name, shard, result_queue, seed + i, write_logs))
+        for i, shard in enumerate(shards)
+    ]
+
+    start = time.perf_counter()
+    try:
+        for worker in workers:
+            worker.start()
+
+        finished_workers = 0
+        while finished_workers < len(workers):
+            try:
+                batch = result_queue.get(timeout=RESULT_TIMEOUT)
+            except queue.Empty:
+                check_workers(workers)
+                if any(worker.is_alive() for worker in workers):
+                    continue
+                # Workers may have sent their last results just before exiting
+                while finished_workers < len(workers):
+                    try:
+                        batch = result_queue.get_nowait()
+                    except queue.Empty:
+                        raise RuntimeError("Workers exited without reporting all their results")
+                    finished_workers += record_batch(stats, batch)
+                continue
+            finished_workers += record_batch(stats, batch)
+
+        for worker in workers:
+            worker.join()
+        check_workers(workers)
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        shm.close()
+        shm.unlink()
+
+    return time.perf_counter() - start
+
+
+def run_load_test(wordlist, max_workers=None, num_games=20000):
+    """
+    Measure throughput for increasing numbers of workers.
+
+    Logs are not written and the statistics are discarded, so the
+    numbers reflect gameplay and aggregation only.
+
+    Args:
+        wordlist: Dictionary of categories and words
+        max_workers: Largest worker count to try (defaults to CPU count)
+        num_games: Number of games played for each worker count
+
+    Returns:
+        List of (num_workers, games_per_second) tuples
+
+    Raises:
+        ValueError: If max_workers or num_games is less than 1
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1 or num_games < 1:
+        raise ValueError("Number of games and workers must be at least 1")
+    worker_counts = []
+    count = 1
+    while count < max_workers:
+        worker_counts.append(count)
+        count *= 2
+    worker_counts.append(max_workers)
+
+    results = []
+    for num_workers in worker_counts:
+        stats = {"games_played": 0, "wins": 0, "losses": 0, "total_score": 0}
+        elapsed = run_sessions(wordlist, num_workers, num_games, stats, write_logs=False)
+        results.append((num_workers, num_games / elapsed))
+    return results
+
+
+def find_flat_scaling(results, min_gain=MIN_SCALING_GAIN):
+    """
+    Find steps in a load test where adding workers did not help.
+
+    Args:
+        results: List of (num_workers, games_per_second) tuples
+        min_gain: Smallest acceptable throughput ratio between steps
+
+    Returns:
+        List of (fewer_workers, more_workers, gain) tuples for each step
+        whose throughput grew by less than min_gain
+    """
+    flat_steps = []
+    for (fewer, slower), (more, faster) in zip(results, results[1:]):
+        gain = faster / slower
+        if gain < min_gain:
+            flat_steps.append((fewer, more, gain))
+    return flat_steps
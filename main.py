@@ -7,12 +7,17 @@ This is the main entry point for the Hangman game.
 It controls the game flow and coordinates between different modules.
 """
 
+import argparse
+import os
+import sys
 from pathlib import Path
 from game.engine import create_game_state, guess_letter, guess_word, get_display_word
 from game.engine import is_game_over, has_won, calculate_score, save_log
 from game.wordlist import load_wordlist, get_random_word, get_categories
 from ui.display import clear_screen, show_welcome, show_game_state
 from game.ascii_art import get_hangman_art
+from game.supervisor import run_sessions, run_load_test, find_flat_scaling
+from game.replay import replay_logs
 import json
 
 
@@ -145,6 +150,102 @@ def play_game(wordlist, game_number, stats):
     return True
 
 
+def run_supervisor(num_workers, num_games, write_logs):
+    """Play automated games across worker processes and save the results."""
+    Path("game_log").mkdir(parents=True, exist_ok=True)
+    
+    wordlist = load_wordlist()
+    stats = load_statistics()
+    games_before = stats["games_played"]
+    
+    # Every game counted in stats already has its log written, so the
+    # statistics are saved even when the run fails or is interrupted
+    try:
+        elapsed = run_sessions(wordlist, num_workers, num_games, stats, write_logs)
+    except RuntimeError as e:
+        games_recorded = stats["games_played"] - games_before
+        print(f"[X] {e}. Recorded {games_recorded} game(s) before the failure.")
+        return False
+    finally:
+        save_statistics(stats)
+    
+    games_recorded = stats["games_played"] - games_before
+    rate = games_recorded / elapsed if elapsed > 0 else 0
+    print(f"Played {games_recorded} games with {num_workers} worker(s) in {elapsed:.2f}s "
+          f"({rate:.0f} games/s)")
+    display_statistics(stats)
+    return True
+
+
+def load_test(max_workers, num_games):
+    """Report throughput for increasing numbers of worker processes."""
+    wordlist = load_wordlist()
+    try:
+        results = run_load_test(wordlist, max_workers, num_games)
+    except RuntimeError as e:
+        print(f"[X] {e}. Load test aborted.")
+        return False
+    
+    baseline = results[0][1]
+    print(f"\n{'Workers':>8} | {'Games/s':>10} | {'Speedup':>8}")
+    print("-" * 32)
+    for num_workers, games_per_second in results:
+        print(f"{num_workers:>8} | {games_per_second:>10.0f} | {games_per_second / baseline:>7.2f}x")
+    
+    flat_steps = find_flat_scaling(results)
+    for fewer, more, gain in flat_steps:
+        print(f"[!] Throughput did not scale from {fewer} to {more} workers ({gain:.2f}x)")
+    if flat_steps:
+        print(f"[!] This machine reports {os.cpu_count()} CPU core(s).")
+    return True
+
+
+def replay(num_workers):
+    """Replay every logged game and report divergences from the engine."""
+    games_checked, failures, elapsed = replay_logs("game_log", num_workers)
+    if games_checked == 0:
+        print("[i] No game logs found in game_log/.")
+    
+    for log_file, divergences in sorted(failures):
+        print(f"[-] {log_file}")
+        for divergence in divergences:
+            print(f"    {divergence}")
+    
+    rate = games_checked / elapsed if elapsed > 0 else 0
+    print(f"\nReplayed {games_checked} games in {elapsed:.2f}s ({rate:.0f} games/s)")
+    print(f"Divergences: {len(failures)}")
+    return not failures
+
+
+def positive_int(value):
+    """Argparse type for integers of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Hangman game")
+    parser.add_argument("--supervisor", action="store_true",
+                        help="play automated games across worker processes")
+    parser.add_argument("--load-test", action="store_true",
+                        help="measure throughput for increasing worker counts")
+    parser.add_argument("--replay", action="store_true",
+                        help="re-run logged games and check them against the engine")
+    parser.add_argument("--workers", type=positive_int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--games", type=positive_int, default=None,
+                        help="number of automated games to play")
+    parser.add_argument("--no-logs", action="store_true",
+                        help="do not write a log file per automated game")
+    return parser.parse_args()
+
+
 def main():
     """Main game loop."""
     # Initialize paths
@@ -182,4 +283,14 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args()
+    if args.replay:
+        sys.exit(0 if replay(args.workers) else 1)
+    elif args.load_test:
+        if not load_test(args.workers, args.games or 20000):
+            sys.exit(1)
+    elif args.supervisor:
+        if not run_supervisor(args.workers or os.cpu_count() or 1, args.games or 1000, not args.no_logs):
+            sys.exit(1)
+    else:
+        main()
\ No newline at end of file